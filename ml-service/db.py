@@ -0,0 +1,57 @@
+"""Database layer for the ML service
+
+Kept out of main.py's import graph on purpose: sqlalchemy costs a few hundred
+milliseconds of import time per worker, so the startup hook imports this
+module lazily instead of paying for it on every boot/reload cycle.
+"""
+
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, Float, DateTime, String
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class PredictionHistory(Base):
+    __tablename__ = "prediction_history"
+    id = Column(Integer, primary_key=True, index=True)
+    model_type = Column(String, index=True)
+    predicted_price = Column(Float)
+    actual_price = Column(Float, nullable=True)
+    prediction_date = Column(DateTime)
+    target_date = Column(DateTime)
+    accuracy_score = Column(Float, nullable=True)
+
+
+engine = None
+AsyncSessionLocal = None
+
+
+def init_engine(database_url: str) -> None:
+    """Create the shared async engine and session factory
+
+    Async engine with a tuned pool: sync DB drivers would block the event
+    loop for every prediction-history write, and the default 5-connection
+    pool is too small under concurrent load. Construction is lazy — no
+    connection is opened until first use — but it still needs the asyncpg
+    driver installed.
+    """
+    global engine, AsyncSessionLocal
+    engine = create_async_engine(
+        database_url.replace("postgresql://", "postgresql+asyncpg://"),
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+    AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def get_session():
+    """FastAPI dependency yielding an AsyncSession from the shared pool"""
+    if AsyncSessionLocal is None:
+        raise HTTPException(status_code=503, detail="Database is not initialized")
+    async with AsyncSessionLocal() as session:
+        yield session
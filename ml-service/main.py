@@ -1,16 +1,19 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi import Depends
 import os
 
-app = FastAPI()
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponseClass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponseClass
+    ORJSON_AVAILABLE = False
 
-# Add rate limiting and security headers
-app.add_middleware(
-    TrustedHostMiddleware, 
-    allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]
-)
+app = FastAPI(default_response_class=DefaultResponseClass)
 
 security = HTTPBearer()
 
@@ -40,21 +43,13 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-from sqlalchemy import create_engine, Column, Integer, Float, DateTime, String
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+# The database layer (sqlalchemy, models, async engine) lives in db.py and
+# is imported lazily from the startup hook, keeping a few hundred ms of
+# sqlalchemy import cost off worker boot.
 
-Base = declarative_base()
+import logging
 
-class PredictionHistory(Base):
-    __tablename__ = "prediction_history"
-    id = Column(Integer, primary_key=True, index=True)
-    model_type = Column(String, index=True)
-    predicted_price = Column(Float)
-    actual_price = Column(Float, nullable=True)
-    prediction_date = Column(DateTime)
-    target_date = Column(DateTime)
-    accuracy_score = Column(Float, nullable=True)
+logger = logging.getLogger(__name__)
 
 from functools import wraps
 
@@ -64,6 +59,10 @@ def handle_ml_errors(func):
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
+        except HTTPException:
+            # Deliberate status codes (e.g. 503 while models are training)
+            # must reach the client, not be flattened into a 500
+            raise
         except ValueError as e:
             logger.error(f"Validation error: {e}")
             raise HTTPException(status_code=400, detail=f"Invalid input: {e}")
@@ -71,3 +70,855 @@ def handle_ml_errors(func):
             logger.error(f"Unhandled error in ML model: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
     return wrapper
+
+
+import asyncio
+import concurrent.futures
+import hashlib
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import aiohttp
+from pydantic import BaseModel
+from typing import List, Dict
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    import tf2onnx
+    import onnxruntime
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:
+    LIGHTGBM_AVAILABLE = False
+
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import r2_score
+import tensorflow as tf
+from tensorflow import keras
+
+# Pin TF threading once at import: all cores for intra-op kernels, no
+# inter-op fan-out, so TF doesn't oversubscribe against the request thread pool
+tf.config.threading.set_intra_op_parallelism_threads(os.cpu_count())
+tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+# Persisted model artifacts so restarted workers skip retraining
+MODELS_PATH = Path(__file__).parent / "models.joblib"
+LSTM_WEIGHTS_PATH = Path(__file__).parent / "lstm.weights.h5"
+
+# Global model state, populated on startup
+price_data = None
+models: Dict[str, object] = {}
+scalers: Dict[str, StandardScaler] = {}
+model_accuracy: Dict[str, float] = {}
+dca_optimizer = None
+
+
+def generate_synthetic_price_data(days: int = 365, base_price: float = 45000.0) -> np.ndarray:
+    """Generate a synthetic BTC price series as a fallback when the market API is unavailable"""
+    rng = np.random.default_rng(42)
+    daily_returns = rng.normal(0.001, 0.04, size=days - 1)
+    factors = np.cumprod(1 + daily_returns)
+    prices = base_price * np.concatenate(([1.0], factors))
+    return np.maximum(prices, 1000.0).astype(np.float32)
+
+
+async def fetch_historical_data(days: int = 365) -> np.ndarray:
+    """Fetch historical BTC price data from CoinGecko, falling back to synthetic data"""
+    url = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
+    params = {"vs_currency": "usd", "days": days, "interval": "daily"}
+    try:
+        async with app.state.http.get(url, params=params) as response:
+            if response.status != 200:
+                raise ValueError(f"Market data API returned {response.status}")
+            # orjson parses the raw body several times faster than the stdlib
+            # decoder aiohttp's .json() would use
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(await response.read())
+            else:
+                data = await response.json()
+        points = data["prices"]
+        return np.fromiter((point[1] for point in points), dtype=np.float32, count=len(points))
+    except Exception as e:
+        logger.warning(f"Failed to fetch historical data ({e}), using synthetic prices")
+        return generate_synthetic_price_data(days)
+
+
+def create_technical_features(prices: np.ndarray) -> np.ndarray:
+    """Build technical indicator features (moving averages, RSI, Bollinger, momentum) from prices
+
+    Uses bottleneck's C rolling primitives on the raw array when available;
+    each pandas .rolling() call pays per-call dispatch overhead and
+    materializes a new Series, which adds up to ~10x on this 8-indicator
+    pipeline.
+    """
+    if not BOTTLENECK_AVAILABLE:
+        return _create_technical_features_pandas(prices)
+
+    # float32 halves the memory traffic through the rolling ops, and the
+    # LSTM consumes float32 downstream anyway
+    prices = np.asarray(prices, dtype=np.float32)
+    returns = np.concatenate(([np.float32(np.nan)], prices[1:] / prices[:-1] - 1))
+    ma_7 = bn.move_mean(prices, 7)
+    ma_21 = bn.move_mean(prices, 21)
+    ma_50 = bn.move_mean(prices, 50)
+    volatility_21 = bn.move_std(returns, 21, ddof=1)
+
+    delta = np.concatenate(([np.float32(np.nan)], np.diff(prices)))
+    gain = bn.move_mean(np.clip(delta, 0, None), 14)
+    loss = bn.move_mean(np.clip(-delta, 0, None), 14)
+    rsi_14 = 100 - 100 / (1 + gain / loss)
+
+    bb_mean = bn.move_mean(prices, 20)
+    bb_std = bn.move_std(prices, 20, ddof=1)
+    bb_position = (prices - bb_mean) / (2 * bb_std)
+
+    momentum_10 = np.concatenate((np.full(10, np.nan, dtype=np.float32), prices[10:] / prices[:-10] - 1))
+
+    features = np.column_stack([
+        returns, ma_7, ma_21, ma_50,
+        volatility_21, rsi_14, bb_position, momentum_10,
+    ])
+    return features[~np.isnan(features).any(axis=1)]
+
+
+def _create_technical_features_pandas(prices: np.ndarray) -> np.ndarray:
+    """Pandas implementation of create_technical_features, kept as the fallback"""
+    df = pd.DataFrame({"price": prices})
+    df["returns"] = df["price"].pct_change()
+    df["ma_7"] = df["price"].rolling(window=7).mean()
+    df["ma_21"] = df["price"].rolling(window=21).mean()
+    df["ma_50"] = df["price"].rolling(window=50).mean()
+    df["volatility_21"] = df["returns"].rolling(window=21).std()
+
+    delta = df["price"].diff()
+    gain = delta.clip(lower=0).rolling(window=14).mean()
+    loss = (-delta.clip(upper=0)).rolling(window=14).mean()
+    df["rsi_14"] = 100 - 100 / (1 + gain / loss)
+
+    bb_mean = df["price"].rolling(window=20).mean()
+    bb_std = df["price"].rolling(window=20).std()
+    df["bb_position"] = (df["price"] - bb_mean) / (2 * bb_std)
+
+    df["momentum_10"] = df["price"] / df["price"].shift(10) - 1
+
+    df = df.dropna()
+    feature_columns = [
+        "returns", "ma_7", "ma_21", "ma_50",
+        "volatility_21", "rsi_14", "bb_position", "momentum_10",
+    ]
+    return df[feature_columns].to_numpy(dtype=np.float32)
+
+
+# Shared generator for request-path noise; PCG64 is faster than the legacy
+# global Mersenne Twister and avoids its global lock
+_rng = np.random.default_rng()
+
+# Model inference and Monte Carlo work runs here so seconds-long synchronous
+# compute doesn't stall the event loop; TF, sklearn and the Numba kernel all
+# release the GIL during the heavy parts
+executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+_feature_cache: Dict = {}
+
+# TTL cache for whole endpoint responses: both POST endpoints are
+# deterministic given (price_data, request params) up to the intentional
+# prediction noise, and price_data only changes on startup/refresh, so warm
+# keys skip the executor round-trip entirely
+_response_cache: Dict = {}
+_RESPONSE_CACHE_TTL = 300.0
+_RESPONSE_CACHE_MAX = 256
+
+
+def _response_cache_get(key):
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if time.monotonic() > expires:
+        del _response_cache[key]
+        return None
+    return value
+
+
+def _response_cache_put(key, value):
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+        _response_cache.clear()
+    _response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, value)
+
+
+@app.middleware("http")
+async def conditional_get_cache(request: Request, call_next):
+    """Serve repeated GETs from the TTL cache with ETag revalidation
+
+    Successful GET bodies are cached alongside a content-hash ETag; within the
+    TTL a matching If-None-Match collapses to a 304 with no handler work, and
+    other repeats skip straight to the cached bytes.
+    """
+    if request.method != "GET":
+        return await call_next(request)
+
+    key = ("etag", request.url.path, str(request.url.query))
+    entry = _response_cache_get(key)
+    if entry is not None:
+        etag, body, headers = entry
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    # Carry the handler's headers through the re-wrap; the cached copy keeps
+    # them too so replays are indistinguishable from the original response
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    _response_cache_put(key, (etag, body, headers))
+    return Response(content=body, status_code=200, headers=headers)
+
+
+# Compress anything beyond half a KB; prediction payloads are repetitive JSON.
+# Registered after (i.e. wrapping) the ETag middleware so the cache sees and
+# stores uncompressed bytes and each replay is compressed per the requesting
+# client's Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Host validation wraps everything — added last so it runs outermost and no
+# request (including ETag cache hits) bypasses the allowed-hosts check
+app.add_middleware(
+    TrustedHostMiddleware,
+    allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]
+)
+
+
+def _last_feature_row(prices: np.ndarray) -> np.ndarray:
+    """Compute only the final technical-feature row with plain NumPy tail slices
+
+    The request path feeds the tree models a single row, so there is no need
+    to run the rolling pipeline over the whole history to produce it. Matches
+    the column order of create_technical_features.
+    """
+    prices = np.asarray(prices, dtype=np.float32)
+    returns_21 = prices[-22:][1:] / prices[-22:][:-1] - 1
+    delta_14 = np.diff(prices[-15:])
+    gain = np.clip(delta_14, 0, None).mean()
+    loss = np.clip(-delta_14, 0, None).mean()
+    bb_window = prices[-20:]
+    return np.array([[
+        prices[-1] / prices[-2] - 1,
+        prices[-7:].mean(),
+        prices[-21:].mean(),
+        prices[-50:].mean(),
+        returns_21.std(ddof=1),
+        100 - 100 / (1 + gain / loss),
+        (prices[-1] - bb_window.mean()) / (2 * bb_window.std(ddof=1)),
+        prices[-1] / prices[-11] - 1,
+    ]], dtype=np.float32)
+
+
+def get_cached_features(prices: np.ndarray):
+    """Memoized per-model scaled feature rows for the request path
+
+    price_data only changes on startup/refresh, so the final feature row and
+    its per-model scaler transforms are computed once and reused by every
+    subsequent /predict call. Keyed on the buffer identity plus the last price
+    so a refreshed series invalidates the entry.
+    """
+    key = (prices.ctypes.data, prices.size, float(prices[-1]))
+    cached = _feature_cache.get(key)
+    if cached is None:
+        last_row = _last_feature_row(prices)
+        # Apply the scalers as plain affine ops, skipping sklearn's validation layer
+        cached = {name: (last_row - scaler.mean_) / scaler.scale_ for name, scaler in scalers.items()}
+        _feature_cache.clear()
+        _feature_cache[key] = cached
+    return cached
+
+
+class LSTMPricePredictor:
+    """LSTM model for autoregressive BTC price forecasting"""
+
+    def __init__(self, lookback_window: int = 60):
+        self.lookback_window = lookback_window
+        self.scaler = MinMaxScaler()
+        self.model = None
+        self._step = None
+        self._forecast = None
+        self._scaler_scale = None
+        self._scaler_min = None
+        self._interpreter = None
+        self._tflite_input = None
+        self._tflite_output = None
+        self._onnx_session = None
+        self._onnx_input_name = None
+
+    def build_model(self) -> keras.Model:
+        """Build the stacked LSTM architecture"""
+        model = keras.Sequential([
+            keras.layers.LSTM(50, return_sequences=True, input_shape=(self.lookback_window, 1)),
+            keras.layers.Dropout(0.2),
+            keras.layers.LSTM(50, return_sequences=True),
+            keras.layers.Dropout(0.2),
+            keras.layers.LSTM(50),
+            keras.layers.Dropout(0.2),
+            keras.layers.Dense(25),
+            keras.layers.Dense(1),
+        ])
+        model.compile(optimizer="adam", loss="mean_squared_error")
+        return model
+
+    def prepare_data(self, prices: np.ndarray):
+        """Scale prices and slice them into (lookback_window, 1) training sequences"""
+        scaled = self.scaler.fit_transform(prices.reshape(-1, 1)).ravel()
+        # Zero-copy sliding windows over the scaled series; each row holds a
+        # lookback window plus its next-step target in the last column
+        windows = np.lib.stride_tricks.sliding_window_view(scaled, self.lookback_window + 1)
+        X = np.ascontiguousarray(windows[:, :-1])[..., None]
+        y = windows[:, -1]
+        return X, y
+
+    def train(self, prices: np.ndarray, epochs: int = 50):
+        """Train the LSTM on the full price history"""
+        X, y = self.prepare_data(prices)
+        self.model = self.build_model()
+        self.model.fit(X, y, batch_size=32, epochs=epochs, verbose=0)
+        self._finalize_inference()
+
+    def restore(self, prices: np.ndarray, weights_path) -> None:
+        """Rebuild the architecture and load persisted weights without retraining"""
+        self.scaler.fit(prices.reshape(-1, 1))
+        self.model = self.build_model()
+        self.model.load_weights(weights_path)
+        self._finalize_inference()
+
+    def _finalize_inference(self):
+        """Prepare the fast inference paths once the model and scaler are fitted"""
+        # Freeze the scaler into plain affine constants; per-call
+        # MinMaxScaler.transform pays sklearn's validation layer every time
+        self._scaler_scale = float(self.scaler.scale_[0])
+        self._scaler_min = float(self.scaler.min_[0])
+        # Compiled single-step inference; model.predict pays ~ms of Keras dispatch per call.
+        # The lookback is fixed at construction, so pin the signature — no retracing
+        # or shape dispatch per call — and let XLA fuse the small LSTM kernels.
+        self._step = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[tf.TensorSpec([1, self.lookback_window, 1], tf.float32)],
+            jit_compile=True,
+        )
+
+        # Full autoregressive rollout as one graph launch: the while_loop keeps
+        # the feedback recurrence on-graph, so a forecast costs one TF dispatch
+        # instead of days_ahead of them. The loop itself is not XLA-compiled
+        # (the TensorArray length is data-dependent), but each step it takes
+        # goes through the jit-compiled _step above.
+        def _rollout(window, n):
+            ta = tf.TensorArray(tf.float32, size=n)
+
+            def body(i, batch, acc):
+                pred = self._step(batch)
+                acc = acc.write(i, pred[0, 0])
+                return i + 1, tf.concat([batch[:, 1:, :], pred[:, None, :]], axis=1), acc
+
+            _, _, ta = tf.while_loop(lambda i, b, a: i < n, body, [tf.constant(0), window, ta])
+            return ta.stack()
+
+        self._forecast = tf.function(
+            _rollout,
+            input_signature=[
+                tf.TensorSpec([1, self.lookback_window, 1], tf.float32),
+                tf.TensorSpec([], tf.int32),
+            ],
+        )
+        self._build_tflite_interpreter()
+        if self._interpreter is None:
+            self._build_onnx_session()
+
+    def _build_onnx_session(self):
+        """Export the model to ONNX Runtime as the backup low-overhead CPU path
+
+        Used when TFLite conversion is unavailable; ORT serves the static
+        graph through MLAS kernels without per-step framework dispatch.
+        """
+        if not ONNX_AVAILABLE:
+            return
+        try:
+            proto, _ = tf2onnx.convert.from_function(
+                tf.function(lambda x: self.model(x, training=False)),
+                input_signature=[tf.TensorSpec((1, self.lookback_window, 1), tf.float32, name="window")],
+                opset=17,
+            )
+            options = onnxruntime.SessionOptions()
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = 1
+            self._onnx_session = onnxruntime.InferenceSession(
+                proto.SerializeToString(), sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            self._onnx_input_name = self._onnx_session.get_inputs()[0].name
+        except Exception as e:
+            logger.warning(f"ONNX export unavailable, serving from tf.function: {e}")
+            self._onnx_session = None
+
+    def _build_tflite_interpreter(self):
+        """Quantize the trained model to TFLite for lighter-weight CPU inference
+
+        Dynamic-range quantization shrinks the weights ~4x and the TFLite
+        interpreter dispatches in microseconds rather than the milliseconds of
+        the full TF runtime. Falls back to the tf.function path on any
+        conversion failure or if the quantized output diverges.
+        """
+        try:
+            # Re-wrap the trained layers behind a static (1, lookback, 1) input;
+            # the LSTM tensor-list lowering requires fully static shapes
+            static_input = keras.Input(batch_shape=(1, self.lookback_window, 1))
+            static_model = keras.Model(static_input, self.model(static_input, training=False))
+            converter = tf.lite.TFLiteConverter.from_keras_model(static_model)
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            interpreter = tf.lite.Interpreter(model_content=converter.convert())
+            interpreter.allocate_tensors()
+            input_detail = interpreter.get_input_details()[0]
+            output_detail = interpreter.get_output_details()[0]
+
+            # Validate the quantized model once against the float graph
+            probe = np.random.default_rng(0).random(
+                (1, self.lookback_window, 1), dtype=np.float32
+            )
+            interpreter.set_tensor(input_detail["index"], probe)
+            interpreter.invoke()
+            quantized = interpreter.get_tensor(output_detail["index"])[0, 0]
+            reference = float(self._step(tf.constant(probe))[0, 0])
+            if not np.isfinite(quantized) or abs(quantized - reference) > max(0.05, abs(reference) * 0.1):
+                raise ValueError(f"quantized output {quantized} diverges from {reference}")
+
+            self._interpreter = interpreter
+            self._tflite_input = input_detail
+            self._tflite_output = output_detail
+        except Exception as e:
+            logger.warning(f"TFLite conversion unavailable, serving from tf.function: {e}")
+            self._interpreter = None
+
+    def predict(self, prices: np.ndarray, days_ahead: int) -> np.ndarray:
+        """Autoregressively forecast the next `days_ahead` prices"""
+        # Affine transform with the frozen scaler constants, applied only to the
+        # lookback window actually fed to the model
+        scaled = prices[-self.lookback_window:] * self._scaler_scale + self._scaler_min
+
+        # The interpreter loops slide a window view over one preallocated
+        # buffer: seed history followed by the predictions as they land, so
+        # each step writes one float instead of reallocating the window
+        W = self.lookback_window
+
+        if self._interpreter is not None:
+            buf = np.empty((1, W + days_ahead, 1), dtype=np.float32)
+            buf[0, :W, 0] = scaled
+            for i in range(days_ahead):
+                self._interpreter.set_tensor(self._tflite_input["index"], buf[:, i:i + W, :])
+                self._interpreter.invoke()
+                buf[0, W + i, 0] = self._interpreter.get_tensor(self._tflite_output["index"])[0, 0]
+            return (buf[0, W:, 0] - self._scaler_min) / self._scaler_scale
+
+        if self._onnx_session is not None:
+            buf = np.empty((1, W + days_ahead, 1), dtype=np.float32)
+            buf[0, :W, 0] = scaled
+            for i in range(days_ahead):
+                pred = self._onnx_session.run(None, {self._onnx_input_name: buf[:, i:i + W, :]})[0]
+                buf[0, W + i, 0] = pred[0, 0]
+            return (buf[0, W:, 0] - self._scaler_min) / self._scaler_scale
+
+        window = tf.constant(
+            scaled.reshape(1, self.lookback_window, 1),
+            dtype=tf.float32,
+        )
+        predictions = self._forecast(window, tf.constant(days_ahead, tf.int32)).numpy()
+        return (predictions - self._scaler_min) / self._scaler_scale
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_kernel(last_price, mean_return, std_return,
+                   amount_per_purchase, total_purchases, simulations):
+        """Monte Carlo DCA kernel: paths run in parallel with no large-matrix allocation"""
+        sim_returns = np.empty(simulations)
+        total_invested = amount_per_purchase * total_purchases
+        for s in prange(simulations):
+            btc_purchased = 0.0
+            for purchase in range(1, total_purchases + 1):
+                shock = np.random.standard_normal()
+                price = last_price * (1.0 + (mean_return + std_return * shock) * purchase)
+                price = max(price, last_price * 0.01)
+                btc_purchased += amount_per_purchase / price
+            portfolio_value = btc_purchased * last_price
+            sim_returns[s] = (portfolio_value - total_invested) / total_invested
+        return sim_returns.mean()
+
+
+class DCAOptimizer:
+    """Monte Carlo based optimizer for DCA purchase frequency and sizing"""
+
+    FREQUENCIES = {"daily": 1, "weekly": 7, "biweekly": 14, "monthly": 30}
+
+    def __init__(self, price_data: np.ndarray):
+        self.refresh(price_data)
+
+    def refresh(self, price_data: np.ndarray) -> None:
+        """Precompute the return statistics; call whenever the price series changes
+
+        Every strategy comparison needs the same mean/std/annualized
+        volatility, so they are derived once per series instead of per call.
+        """
+        self.price_data = price_data
+        returns = np.diff(price_data) / price_data[:-1]
+        self._mean_return = float(np.mean(returns))
+        self._std_return = float(np.std(returns))
+        self._volatility = self._std_return * float(np.sqrt(365))
+        self._last_price = float(price_data[-1])
+
+    def _monte_carlo_simulation(self, mean_return: float, std_return: float,
+                                amount_per_purchase: float, total_purchases: int,
+                                simulations: int = 1000) -> float:
+        """
+        Estimate the expected DCA return over `simulations` simulated price paths.
+
+        Dispatches to the parallel Numba kernel when available; otherwise draws
+        all random shocks as one (simulations, total_purchases) matrix and
+        computes purchase prices, BTC accumulated, and portfolio returns with
+        vectorized operations along axis=1 — no Python-level per-path loop.
+        """
+        last_price = self._last_price
+        if NUMBA_AVAILABLE:
+            return float(_mc_kernel(
+                last_price, mean_return, std_return,
+                amount_per_purchase, total_purchases, simulations,
+            ))
+
+        rng = np.random.default_rng()
+        shocks = rng.standard_normal((simulations, total_purchases), dtype=np.float32)
+        purchase_idx = np.arange(1, total_purchases + 1, dtype=np.float32)
+        simulated_prices = last_price * (1 + (mean_return + std_return * shocks) * purchase_idx)
+        np.maximum(simulated_prices, last_price * 0.01, out=simulated_prices)
+
+        btc_purchased = amount_per_purchase / simulated_prices
+        portfolio_value = btc_purchased.sum(axis=1) * last_price
+        total_invested = amount_per_purchase * total_purchases
+        sim_returns = (portfolio_value - total_invested) / total_invested
+        return float(sim_returns.mean())
+
+    def calculate_optimal_strategy(self, investment_amount: float, duration_months: int,
+                                   risk_tolerance: str = "medium") -> Dict:
+        """Compare DCA frequencies via Monte Carlo and return the best-performing strategy"""
+        mean_return, std_return, volatility = self._mean_return, self._std_return, self._volatility
+
+        risk_multiplier = {"low": 0.5, "medium": 1.0, "high": 1.5}[risk_tolerance]
+
+        frequency_analysis = {}
+        for frequency, interval_days in self.FREQUENCIES.items():
+            total_purchases = max(1, int(duration_months * 30 / interval_days))
+            amount_per_purchase = investment_amount / total_purchases
+            expected_return = self._monte_carlo_simulation(
+                mean_return * risk_multiplier, std_return,
+                amount_per_purchase, total_purchases,
+            )
+            frequency_analysis[frequency] = {
+                "expected_return": expected_return,
+                "total_purchases": total_purchases,
+                "amount_per_purchase": amount_per_purchase,
+            }
+
+        optimal_frequency = max(frequency_analysis, key=lambda f: frequency_analysis[f]["expected_return"])
+        optimal = frequency_analysis[optimal_frequency]
+
+        return {
+            "optimal_frequency": optimal_frequency,
+            "amount_per_purchase": optimal["amount_per_purchase"],
+            "total_purchases": optimal["total_purchases"],
+            "expected_return": optimal["expected_return"],
+            "risk_score": volatility * risk_multiplier,
+            "frequency_analysis": frequency_analysis,
+        }
+
+
+class PredictionRequest(BaseModel):
+    days_ahead: int = 7
+    model_type: str = "lstm"
+
+
+class PredictionResponse(BaseModel):
+    predicted_prices: List[float]
+    confidence_interval: Dict[str, List[float]]
+    model_accuracy: float
+
+
+class DCAOptimizationRequest(BaseModel):
+    investment_amount: float
+    duration_months: int
+    risk_tolerance: str = "medium"
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Fetch price history and train all prediction models before serving traffic"""
+    global price_data, dca_optimizer
+
+    # One pooled HTTP session for the process; per-call sessions pay DNS,
+    # TCP and TLS setup on every request
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+    # Lazy DB setup: importing db pulls in sqlalchemy only now, not at
+    # worker-boot import time
+    try:
+        import db
+        db.init_engine(settings.database_url)
+    except ImportError as e:
+        logger.warning(f"Database layer unavailable: {e}")
+
+    price_data = await fetch_historical_data()
+    logger.info(f"Loaded {len(price_data)} days of price history")
+
+    data_hash = hashlib.blake2b(price_data.tobytes(), digest_size=16).hexdigest()
+    artifacts = _load_saved_models(data_hash)
+    if artifacts is not None:
+        lstm = LSTMPricePredictor()
+        lstm.restore(price_data, LSTM_WEIGHTS_PATH)
+        models["lstm"] = lstm
+        models["rf"] = artifacts["rf"]
+        models["gb"] = artifacts["gb"]
+        scalers.update(artifacts["scalers"])
+        model_accuracy.update(artifacts["model_accuracy"])
+        logger.info("Restored persisted models, skipping training")
+    else:
+        _train_all_models(data_hash)
+
+    if NUMBA_AVAILABLE:
+        # Trigger the JIT compile here so the first /optimize-dca request doesn't pay for it
+        _mc_kernel(1.0, 0.0, 0.01, 1.0, 2, 2)
+
+    dca_optimizer = DCAOptimizer(price_data)
+
+    # Run each inference path once so lazy TF/XLA/sklearn initialization and
+    # the feature cache are materialized before the first real request
+    try:
+        _compute_predictions("ensemble", 1)
+    except Exception as e:
+        logger.warning(f"Inference warmup failed: {e}")
+
+    logger.info(f"Models trained: {model_accuracy}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP session"""
+    await app.state.http.close()
+
+
+def _load_saved_models(data_hash: str):
+    """Load persisted model artifacts if they match the current price history"""
+    if not (MODELS_PATH.exists() and LSTM_WEIGHTS_PATH.exists()):
+        return None
+    try:
+        artifacts = joblib.load(MODELS_PATH)
+    except Exception as e:
+        logger.warning(f"Could not load persisted models ({e}), retraining")
+        return None
+    if artifacts.get("data_hash") != data_hash:
+        logger.info("Persisted models are stale, retraining")
+        return None
+    return artifacts
+
+
+def _train_all_models(data_hash: str):
+    """Train all models from scratch and persist the artifacts"""
+    # LSTM
+    lstm = LSTMPricePredictor()
+    lstm.train(price_data)
+    models["lstm"] = lstm
+    X, y = lstm.prepare_data(price_data)
+    holdout = max(1, len(X) // 5)
+    lstm_preds = lstm.model.predict(X[-holdout:], verbose=0).ravel()
+    model_accuracy["lstm"] = float(r2_score(y[-holdout:], lstm_preds))
+
+    # Tree models predict the next-day price from technical features
+    features = create_technical_features(price_data)
+    offset = len(price_data) - len(features)
+    target = price_data[offset + 1:]
+    features = features[:-1]
+
+    # One scaler and one split feed both tree models; they trained on
+    # identical features, so fitting them separately was duplicated work
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(features)
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, target, test_size=0.2, random_state=42)
+    scalers["rf"] = scalers["gb"] = scaler
+
+    rf = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
+    rf.fit(X_train, y_train)
+    # Single-row predicts: joblib's parallel fan-out costs more than it saves
+    rf.n_jobs = 1
+    models["rf"] = rf
+    model_accuracy["rf"] = float(r2_score(y_test, rf.predict(X_test)))
+
+    if LIGHTGBM_AVAILABLE:
+        # Histogram-based splits train faster and its tree traversal at
+        # predict time stays in C, unlike sklearn's boosted ensemble
+        gb = lgb.LGBMRegressor(n_estimators=100, num_leaves=15, random_state=42, n_jobs=-1, verbose=-1)
+    else:
+        gb = GradientBoostingRegressor(n_estimators=100, random_state=42)
+    gb.fit(X_train, y_train)
+    models["gb"] = gb
+    model_accuracy["gb"] = float(r2_score(y_test, gb.predict(X_test)))
+
+    model_accuracy["ensemble"] = float(np.mean([
+        model_accuracy["lstm"], model_accuracy["rf"], model_accuracy["gb"],
+    ]))
+
+    try:
+        joblib.dump({
+            "data_hash": data_hash,
+            "rf": models["rf"],
+            "gb": models["gb"],
+            "scalers": dict(scalers),
+            "model_accuracy": dict(model_accuracy),
+        }, MODELS_PATH)
+        lstm.model.save_weights(LSTM_WEIGHTS_PATH)
+    except Exception as e:
+        logger.warning(f"Could not persist trained models: {e}")
+
+
+@app.post("/predict", response_model=PredictionResponse)
+@handle_ml_errors
+async def predict_price(request: PredictionRequest):
+    """Predict BTC prices for the requested horizon with the requested model"""
+    if price_data is None or not models:
+        raise HTTPException(status_code=503, detail="Models are still training, try again shortly")
+
+    days_ahead = request.days_ahead
+    model_type = request.model_type
+    if not 1 <= days_ahead <= settings.max_prediction_days:
+        raise ValueError(f"days_ahead must be between 1 and {settings.max_prediction_days}")
+    if model_type not in ("lstm", "rf", "gb", "ensemble"):
+        raise ValueError("model_type must be one of: lstm, rf, gb, ensemble")
+
+    cache_key = ("predict", model_type, days_ahead, price_data.size, float(price_data[-1]))
+    content = _response_cache_get(cache_key)
+    if content is not None:
+        return DefaultResponseClass(content)
+
+    loop = asyncio.get_running_loop()
+    if model_type == "ensemble":
+        # Run the member models on separate pool threads; TF and sklearn both
+        # release the GIL in their compute kernels, so the LSTM rollout and
+        # tree predictions genuinely overlap
+        member_predictions = await asyncio.gather(*(
+            loop.run_in_executor(executor, _compute_predictions, member, days_ahead)
+            for member in ("lstm", "rf", "gb")
+        ))
+        predictions = np.mean(member_predictions, axis=0)
+    else:
+        predictions = await loop.run_in_executor(executor, _compute_predictions, model_type, days_ahead)
+
+    daily_volatility = float(np.std(np.diff(price_data) / price_data[:-1]))
+    lower_bound = predictions * (1 - 1.96 * daily_volatility)
+    upper_bound = predictions * (1 + 1.96 * daily_volatility)
+
+    # Hand the arrays to the response as-is: orjson walks the NumPy buffers
+    # directly (OPT_SERIALIZE_NUMPY), so no per-element PyFloat boxing happens.
+    # The stdlib-json fallback still needs plain lists.
+    if not ORJSON_AVAILABLE:
+        predictions = predictions.tolist()
+        lower_bound = lower_bound.tolist()
+        upper_bound = upper_bound.tolist()
+    content = {
+        "predicted_prices": predictions,
+        "confidence_interval": {"lower": lower_bound, "upper": upper_bound},
+        "model_accuracy": model_accuracy[model_type],
+    }
+    _response_cache_put(cache_key, content)
+    return DefaultResponseClass(content)
+
+
+def _compute_predictions(model_type: str, days_ahead: int) -> np.ndarray:
+    """Synchronous single-model inference, run on the worker thread pool
+
+    The ensemble is composed in the /predict handler by gathering these
+    per-model calls concurrently.
+    """
+    if model_type == "lstm":
+        predictions = models["lstm"].predict(price_data, days_ahead)
+    elif model_type == "ensemble":
+        predictions = np.mean([
+            _compute_predictions(member, days_ahead) for member in ("lstm", "rf", "gb")
+        ], axis=0)
+    else:  # rf / gb
+        scaled_last = get_cached_features(price_data)
+        base_prediction = models[model_type].predict(scaled_last[model_type])[0]
+        predictions = base_prediction * (1 + _rng.standard_normal(days_ahead) * 0.02)
+    return predictions
+
+
+@app.post("/optimize-dca")
+@handle_ml_errors
+async def optimize_dca_strategy(request: DCAOptimizationRequest):
+    """Find the optimal DCA frequency and sizing for the requested investment"""
+    if dca_optimizer is None:
+        raise HTTPException(status_code=503, detail="Optimizer is still initializing, try again shortly")
+
+    if not 100 <= request.investment_amount <= 10_000_000:
+        raise ValueError("investment_amount must be between 100 and 10,000,000")
+    if not 1 <= request.duration_months <= 120:
+        raise ValueError("duration_months must be between 1 and 120")
+    if request.risk_tolerance not in ("low", "medium", "high"):
+        raise ValueError("risk_tolerance must be one of: low, medium, high")
+
+    cache_key = (
+        "optimize-dca", request.investment_amount, request.duration_months,
+        request.risk_tolerance, price_data.size, float(price_data[-1]),
+    )
+    result = _response_cache_get(cache_key)
+    if result is None:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            executor, dca_optimizer.calculate_optimal_strategy,
+            request.investment_amount, request.duration_months, request.risk_tolerance,
+        )
+        _response_cache_put(cache_key, result)
+    return result
+
+
+@app.get("/model-performance")
+async def get_model_performance():
+    """Return the latest accuracy scores for all trained models"""
+    if not model_accuracy:
+        raise HTTPException(status_code=503, detail="Models are still training, try again shortly")
+    return {"model_accuracy": model_accuracy}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    # uvloop + httptools ship with uvicorn[standard] and roughly halve
+    # per-request event loop and HTTP parsing overhead
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop="uvloop", http="httptools")
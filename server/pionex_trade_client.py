@@ -10,42 +10,60 @@ including DCA bots, which are relevant to this BTC DCA intelligence platform.
 """
 
 import asyncio
+import functools
 import hashlib
+import heapq
 import hmac
+import itertools
 import json
 import logging
+import secrets
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import aiohttp
+import numpy as np
 import os
 from dataclasses import dataclass
 from enum import Enum
 
+from dca_scoring import dca_multiplier, dca_multipliers
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
 
-class OrderSide(Enum):
+# str subclasses: members serialize directly (orjson and stdlib json both
+# emit them as plain strings), so request payloads need no .value lookups
+class OrderSide(str, Enum):
     """Order side enumeration"""
     BUY = "BUY"
     SELL = "SELL"
 
 
-class OrderType(Enum):
+class OrderType(str, Enum):
     """Order type enumeration"""
     MARKET = "MARKET"
     LIMIT = "LIMIT"
 
 
-class DCAStatus(Enum):
+class DCAStatus(str, Enum):
     """DCA bot status enumeration"""
     RUNNING = "RUNNING"
     STOPPED = "STOPPED"
     PAUSED = "PAUSED"
 
 
-@dataclass
+# Slotted and frozen: no per-instance __dict__ (smaller and faster to read
+# when thousands of strategies/results accumulate), and hashable for use as
+# cache keys; update via dataclasses.replace where needed
+@dataclass(slots=True, frozen=True)
 class PionexCredentials:
     """Pionex API credentials"""
     api_key: str
@@ -54,7 +72,7 @@ class PionexCredentials:
     base_url: str = "https://api.pionex.com"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DCAConfig:
     """DCA bot configuration"""
     symbol: str
@@ -65,7 +83,7 @@ class DCAConfig:
     min_price: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingResult:
     """Trading operation result"""
     success: bool
@@ -94,70 +112,143 @@ class PionexTradeClient:
         """
         self.credentials = credentials
         self.session = None
-        self.rate_limit_delay = 0.1  # 100ms between requests
-        self.last_request_time = 0
-        
+        # Token bucket: up to `_rate` requests per second, refilled continuously
+        # on the event loop's monotonic clock
+        self._rate = 10.0
+        self._tokens = self._rate
+        self._last_refill = None
+        self._rate_lock = asyncio.Lock()
+        # Pre-initialized HMAC template: the per-request signature clones this
+        # state in O(1) instead of re-running the key schedule every time
+        self._hmac_template = hmac.new(credentials.api_secret.encode(), None, hashlib.sha256)
+        # Bounded per-instance memo over the full signing tuple: polling loops
+        # that sign the same (timestamp, method, path) within one millisecond
+        # get a dict hit instead of an HMAC run. Bound per instance (not a
+        # module-level cache) so the entries die with the client and never mix
+        # credentials.
+        self._sign = functools.lru_cache(maxsize=256)(self._compute_signature)
+        # Key for internal (non-exchange) MACs. BLAKE2b's keyed mode is one
+        # pass over the message with no HMAC pad dance — the exchange mandates
+        # HMAC-SHA256 for API signatures, but client-side tokens don't.
+        self._internal_mac_key = secrets.token_bytes(32)
+        # Monotonic nonce mixed into client order ids so concurrent orders
+        # for the same symbol/side in the same millisecond stay distinct
+        self._order_seq = itertools.count()
+        # Static header fields, merged with the per-request signature and
+        # timestamp instead of rebuilding the whole dict each call
+        self._header_template = {
+            "PIONEX-KEY": credentials.api_key,
+            "PIONEX-PASSPHRASE": credentials.passphrase,
+            "Content-Type": "application/json",
+        }
+
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        # One pooled session for the client's lifetime: keep-alive connections
+        # skip the TCP+TLS handshake on every call after the first, and the
+        # DNS cache avoids re-resolving api.pionex.com per request
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
         return self
-        
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
     
-    def _generate_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
+    def _generate_signature(self, timestamp: str, method: str, path: str, body: bytes = b"") -> str:
         """
         Generate API signature for authentication
-        
+
         Args:
             timestamp: Request timestamp
             method: HTTP method
             path: API endpoint path
-            body: Request body
-            
+            body: Serialized request body
+
         Returns:
             HMAC signature
         """
-        message = timestamp + method.upper() + path + body
-        signature = hmac.new(
-            self.credentials.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self._sign(timestamp, method, path, body)
+
+    # Canonical method bytes, interned once — signing skips the per-call
+    # upper()/encode() for the verbs the client actually sends
+    _METHOD_BYTES = {
+        "GET": b"GET", "POST": b"POST", "PUT": b"PUT", "DELETE": b"DELETE",
+    }
+
+    def _compute_signature(self, timestamp: str, method: str, path: str, body: bytes) -> str:
+        """Compute the HMAC-SHA256 signature (cache miss path of _sign)"""
+        # Feed the canonical message parts straight into the HMAC state —
+        # no concatenated str intermediate and no whole-message re-encode
+        mac = self._hmac_template.copy()
+        mac.update(timestamp.encode("ascii"))
+        method_bytes = self._METHOD_BYTES.get(method)
+        if method_bytes is None:
+            method_bytes = method.upper().encode("ascii")
+        mac.update(method_bytes)
+        mac.update(path.encode("ascii"))
+        if body:
+            mac.update(body)
+        return mac.hexdigest()
     
-    def _get_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+    def _internal_sign(self, msg: bytes) -> str:
+        """Keyed BLAKE2b MAC for client-side tokens (order correlation IDs)
+
+        Not for exchange authentication — Pionex requires HMAC-SHA256 there.
+        """
+        return hashlib.blake2b(msg, key=self._internal_mac_key, digest_size=16).hexdigest()
+
+    def _get_headers(self, method: str, path: str, body: bytes = b"") -> Dict[str, str]:
         """
         Get request headers with authentication
-        
+
         Args:
             method: HTTP method
             path: API endpoint path
-            body: Request body
-            
+            body: Serialized request body
+
         Returns:
             Request headers
         """
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(time.time_ns() // 1_000_000)
         signature = self._generate_signature(timestamp, method, path, body)
-        
+
         return {
-            "PIONEX-KEY": self.credentials.api_key,
+            **self._header_template,
             "PIONEX-SIGNATURE": signature,
             "PIONEX-TIMESTAMP": timestamp,
-            "PIONEX-PASSPHRASE": self.credentials.passphrase,
-            "Content-Type": "application/json"
         }
     
     async def _rate_limit(self):
-        """Implement rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        """Take one token from the rate budget, sleeping until one is available
+
+        Uses loop.time() (monotonic, immune to NTP adjustments) rather than
+        the wall clock, and lets concurrent coroutines interleave up to the
+        per-second budget instead of strictly serializing behind a single
+        last-request timestamp.
+        """
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._last_refill is not None:
+                self._tokens = min(self._rate, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+                self._last_refill = loop.time()
+                self._tokens = 0.0
+            else:
+                self._tokens -= 1.0
     
     async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
                       data: Optional[Dict] = None) -> Dict:
@@ -179,19 +270,26 @@ class PionexTradeClient:
         await self._rate_limit()
         
         url = f"{self.credentials.base_url}{endpoint}"
-        body = json.dumps(data) if data else ""
-        headers = self._get_headers(method, endpoint, body)
-        
+        # Serialize once with orjson when available (C-level, compact output);
+        # the same bytes feed both the signature and the request body
+        if data:
+            body_bytes = orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode()
+        else:
+            body_bytes = None
+        headers = self._get_headers(method, endpoint, body_bytes or b"")
+
         try:
             async with self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
-                data=body if body else None,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=body_bytes,
             ) as response:
-                response_data = await response.json()
+                if ORJSON_AVAILABLE:
+                    response_data = orjson.loads(await response.read())
+                else:
+                    response_data = await response.json()
                 
                 if response.status != 200:
                     logger.error(f"API request failed: {response.status} - {response_data}")
@@ -235,7 +333,27 @@ class PionexTradeClient:
             logger.error(f"Failed to get ticker for {symbol}: {e}")
             raise
     
-    async def create_market_order(self, symbol: str, side: OrderSide, 
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get ticker information for several symbols concurrently
+
+        The requests overlap up to the connection pool and rate budget, so N
+        symbols cost roughly one round trip instead of N sequential ones.
+
+        Args:
+            symbols: Trading pair symbols (e.g., ["BTCUSDT", "ETHUSDT"])
+
+        Returns:
+            Mapping of symbol to ticker data; a failed symbol maps to its
+            exception rather than aborting the whole batch
+        """
+        results = await asyncio.gather(
+            *(self.get_ticker(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return dict(zip(symbols, results))
+
+    async def create_market_order(self, symbol: str, side: OrderSide,
                                  quantity: Optional[float] = None,
                                  quote_quantity: Optional[float] = None) -> TradingResult:
         """
@@ -251,11 +369,19 @@ class PionexTradeClient:
             Trading result
         """
         try:
+            timestamp = time.time_ns() // 1_000_000
             order_data = {
                 "symbol": symbol,
-                "side": side.value,
-                "type": OrderType.MARKET.value,
-                "timestamp": int(time.time() * 1000)
+                "side": side,
+                "type": OrderType.MARKET,
+                "timestamp": timestamp,
+                # Correlation token for log/retry matching; keyed BLAKE2b is
+                # a single pass, cheaper than an HMAC-based nonce. The
+                # per-client counter keeps ids unique when concurrent orders
+                # share symbol, side and millisecond.
+                "clientOrderId": self._internal_sign(
+                    f"{symbol}{side}{timestamp}{next(self._order_seq)}".encode("ascii")
+                ),
             }
             
             if quantity:
@@ -298,7 +424,7 @@ class PionexTradeClient:
                 "symbol": config.symbol,
                 "investmentAmount": str(config.investment_amount),
                 "frequency": config.frequency_hours,
-                "timestamp": int(time.time() * 1000)
+                "timestamp": time.time_ns() // 1_000_000
             }
             
             if config.target_amount:
@@ -352,7 +478,7 @@ class PionexTradeClient:
         try:
             data = {
                 "botId": bot_id,
-                "timestamp": int(time.time() * 1000)
+                "timestamp": time.time_ns() // 1_000_000
             }
             
             response = await self._request("POST", "/api/v1/dca/stop", data=data)
@@ -427,7 +553,60 @@ class PionexDCAManager:
         """
         self.client = client
         self.active_strategies: Dict[str, DCAConfig] = {}
-    
+        # Parallel structure-of-arrays columns for bulk analytics: aggregate
+        # questions over thousands of strategies reduce over one contiguous
+        # float array instead of walking per-object attributes
+        self._idx: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._amounts = np.empty(8, dtype=np.float64)
+        self._count = 0
+        # Private fire-time heap of (when, seq, callback) tuples: comparisons
+        # stop at the pre-extracted float instead of descending into handle
+        # objects, and the seq counter keeps equal fire times FIFO
+        self._scheduled: List[tuple] = []
+        self._schedule_seq = itertools.count()
+
+    def _register_strategy(self, strategy_id: str, symbol: str, amount: float) -> None:
+        """Append a strategy to the analytics columns, doubling capacity as needed
+
+        Re-registering an existing ID updates its row in place, mirroring the
+        dict-overwrite semantics of active_strategies.
+        """
+        row = self._idx.get(strategy_id)
+        if row is not None:
+            self._amounts[row] = amount
+            self._symbols[row] = symbol
+            return
+        if self._count == self._amounts.size:
+            self._amounts = np.resize(self._amounts, self._amounts.size * 2)
+        self._amounts[self._count] = amount
+        self._idx[strategy_id] = self._count
+        self._symbols.append(symbol)
+        self._count += 1
+
+    def _schedule(self, when: float, callback) -> None:
+        """Queue a strategy callback to fire at monotonic time `when`"""
+        heapq.heappush(self._scheduled, (when, next(self._schedule_seq), callback))
+
+    def _pop_due(self, now: float) -> List:
+        """Pop every callback whose fire time has passed, in fire order"""
+        due = []
+        while self._scheduled and self._scheduled[0][0] <= now:
+            due.append(heapq.heappop(self._scheduled)[2])
+        return due
+
+    def total_exposure(self) -> float:
+        """Total per-period investment across all active strategies"""
+        return float(self._amounts[:self._count].sum())
+
+    def exposure_per_symbol(self) -> Dict[str, float]:
+        """Per-period investment grouped by trading pair"""
+        if self._count == 0:
+            return {}
+        symbols, inverse = np.unique(np.array(self._symbols), return_inverse=True)
+        totals = np.bincount(inverse, weights=self._amounts[:self._count])
+        return dict(zip(symbols.tolist(), totals.tolist()))
+
     async def create_intelligent_dca(self, symbol: str, weekly_amount: float,
                                    fear_greed_threshold: int = 50) -> str:
         """
@@ -450,11 +629,42 @@ class PionexDCAManager:
         )
         
         self.active_strategies[strategy_id] = config
-        
+        self._register_strategy(strategy_id, symbol, weekly_amount)
+
         logger.info(f"Created intelligent DCA strategy: {strategy_id}")
         return strategy_id
     
-    async def execute_intelligent_dca(self, strategy_id: str, 
+    async def create_intelligent_dca_batch(self, entries: List[tuple]) -> List[str]:
+        """
+        Create many intelligent DCA strategies in one call
+
+        Strategy registration is pure dict/array writes, so onboarding a
+        whole portfolio shouldn't pay per-strategy awaits: the batch builds
+        every record synchronously under a single timestamp.
+
+        Args:
+            entries: (symbol, weekly_amount) pairs
+
+        Returns:
+            Strategy IDs, in input order
+        """
+        nanos = time.time_ns()
+        strategy_ids = []
+        for i, (symbol, weekly_amount) in enumerate(entries):
+            strategy_id = f"intelligent_dca_{symbol}_{nanos}_{i}"
+            config = DCAConfig(
+                symbol=symbol,
+                investment_amount=weekly_amount,
+                frequency_hours=168  # Weekly
+            )
+            self.active_strategies[strategy_id] = config
+            self._register_strategy(strategy_id, symbol, weekly_amount)
+            strategy_ids.append(strategy_id)
+
+        logger.info(f"Created {len(strategy_ids)} intelligent DCA strategies in batch")
+        return strategy_ids
+
+    async def execute_intelligent_dca(self, strategy_id: str,
                                     fear_greed_index: Optional[int] = None) -> TradingResult:
         """
         Execute DCA with intelligence based on market conditions
@@ -477,49 +687,84 @@ class PionexDCAManager:
         
         # Adjust amount based on Fear & Greed index
         if fear_greed_index is not None:
-            if fear_greed_index < 25:  # Extreme Fear - buy more
-                amount *= 1.5
+            multiplier = dca_multiplier(fear_greed_index)
+            if multiplier > 1.0:  # Extreme Fear - buy more
                 logger.info(f"Extreme Fear detected ({fear_greed_index}), increasing DCA by 50%")
-            elif fear_greed_index > 75:  # Extreme Greed - buy less
-                amount *= 0.5
+            elif multiplier < 1.0:  # Extreme Greed - buy less
                 logger.info(f"Extreme Greed detected ({fear_greed_index}), reducing DCA by 50%")
-        
+            amount *= multiplier
+
         return await self.client.execute_dca_strategy(config.symbol, amount)
 
+    def batch_recommend(self, base_amount: float, fear_greed: np.ndarray,
+                        confidence: Optional[np.ndarray] = None,
+                        bullish: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute DCA amounts for arrays of historical market conditions
+
+        Intended for backtesting sweeps: the adjustment rule runs through the
+        compiled kernel in dca_scoring instead of per-row Python branches.
 
-# Factory function for easy client creation
-def create_pionex_client() -> PionexTradeClient:
+        Args:
+            base_amount: Unadjusted per-purchase amount
+            fear_greed: Fear & Greed index values (0-100)
+            confidence: Optional ML prediction confidences (0-1)
+            bullish: Optional ML trend flags (True = bullish)
+
+        Returns:
+            Adjusted DCA amount per row
+        """
+        fng = np.ascontiguousarray(fear_greed, dtype=np.float64)
+        conf = (np.zeros(fng.size) if confidence is None
+                else np.ascontiguousarray(confidence, dtype=np.float64))
+        bull = (np.zeros(fng.size, dtype=np.bool_) if bullish is None
+                else np.ascontiguousarray(bullish, dtype=np.bool_))
+        return base_amount * dca_multipliers(fng, conf, bull)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials() -> PionexCredentials:
     """
-    Create Pionex trading client from environment variables
-    
-    Required environment variables:
-    - PIONEX_API_KEY
-    - PIONEX_API_SECRET
-    - PIONEX_PASSPHRASE
-    
-    Returns:
-        Configured Pionex trading client
-        
-    Raises:
-        ValueError: If required environment variables are missing
+    Read and validate Pionex credentials from the environment, once
+
+    Credentials are immutable for the process lifetime, so the env lookups
+    and validation run on first use only; a failed lookup is not cached and
+    is retried on the next call.
     """
     api_key = os.getenv("PIONEX_API_KEY")
     api_secret = os.getenv("PIONEX_API_SECRET")
     passphrase = os.getenv("PIONEX_PASSPHRASE")
-    
+
     if not all([api_key, api_secret, passphrase]):
         raise ValueError(
             "Missing required environment variables: "
             "PIONEX_API_KEY, PIONEX_API_SECRET, PIONEX_PASSPHRASE"
         )
-    
-    credentials = PionexCredentials(
+
+    return PionexCredentials(
         api_key=api_key,
         api_secret=api_secret,
         passphrase=passphrase
     )
-    
-    return PionexTradeClient(credentials)
+
+
+# Factory function for easy client creation
+def create_pionex_client() -> PionexTradeClient:
+    """
+    Create Pionex trading client from environment variables
+
+    Required environment variables:
+    - PIONEX_API_KEY
+    - PIONEX_API_SECRET
+    - PIONEX_PASSPHRASE
+
+    Returns:
+        Configured Pionex trading client
+
+    Raises:
+        ValueError: If required environment variables are missing
+    """
+    return PionexTradeClient(_load_credentials())
 
 
 # Example usage
@@ -559,6 +804,13 @@ if __name__ == "__main__":
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
+    # Prefer the libuv event loop for the HTTP-heavy example when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run example
     asyncio.run(main())
\ No newline at end of file
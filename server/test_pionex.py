@@ -4,32 +4,107 @@ Simple test to validate the Pionex Trading Client implementation
 """
 
 import asyncio
+import functools
+import importlib
+import math
 import sys
 import os
+import threading
 
 # Add server directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+_MODULE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "pionex_trade_client.py")
+_MEMO_FILE = os.path.expanduser("~/.cache/pionex_tests.json")
+_memo_lock = threading.Lock()
+
+
+def memoize_on_src_hash(test_func):
+    """Skip a pure test when the module source is unchanged since it passed
+
+    Watch-mode convenience, opt-in via PIONEX_TEST_MEMO=1: a passing run
+    records a hash of pionex_trade_client.py, and later runs short-circuit
+    while the source hash still matches. Off by default so CI always
+    executes everything.
+    """
+    import functools
+    import hashlib
+    import json
+
+    @functools.wraps(test_func)
+    def wrapper():
+        if not os.getenv("PIONEX_TEST_MEMO"):
+            return test_func()
+        with open(_MODULE_FILE, "rb") as f:
+            src_hash = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+        with _memo_lock:
+            try:
+                with open(_MEMO_FILE) as f:
+                    memo = json.load(f)
+            except (OSError, ValueError):
+                memo = {}
+        if memo.get(test_func.__name__) == src_hash:
+            print(f"✓ {test_func.__name__} skipped (source unchanged)")
+            return True
+        result = test_func()
+        if result:
+            # Read-modify-write under a lock: memoized tests run
+            # concurrently in worker threads
+            with _memo_lock:
+                try:
+                    with open(_MEMO_FILE) as f:
+                        memo = json.load(f)
+                except (OSError, ValueError):
+                    memo = {}
+                memo[test_func.__name__] = src_hash
+                os.makedirs(os.path.dirname(_MEMO_FILE), exist_ok=True)
+                with open(_MEMO_FILE, "w") as f:
+                    json.dump(memo, f)
+        return result
+    return wrapper
+
+
+_CLIENT_EXPORTS = (
+    "PionexTradeClient",
+    "PionexDCAManager",
+    "PionexCredentials",
+    "DCAConfig",
+    "TradingResult",
+    "OrderSide",
+    "OrderType",
+    "DCAStatus",
+    "create_pionex_client",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_client_exports():
+    """Resolve the public client names from the already-loaded module
+
+    A sys.modules hit plus getattr skips the finder/loader machinery the
+    `from ... import (...)` statement re-runs on every call; the lru_cache
+    makes repeat invocations a plain dict lookup.
+    """
+    mod = sys.modules.get("pionex_trade_client")
+    if mod is None:
+        mod = importlib.import_module("pionex_trade_client")
+    return tuple(getattr(mod, name) for name in _CLIENT_EXPORTS)
+
+
+@memoize_on_src_hash
 def test_imports():
     """Test that all modules import correctly"""
     try:
-        from pionex_trade_client import (
-            PionexTradeClient,
-            PionexDCAManager,
-            PionexCredentials,
-            DCAConfig,
-            TradingResult,
-            OrderSide,
-            OrderType,
-            DCAStatus,
-            create_pionex_client
-        )
+        exports = _resolve_client_exports()
+        assert len(exports) == len(_CLIENT_EXPORTS)
         print("✓ All imports successful")
         return True
-    except ImportError as e:
+    except (ImportError, AttributeError) as e:
         print(f"❌ Import error: {e}")
         return False
 
+@memoize_on_src_hash
 def test_data_structures():
     """Test that data structures can be created"""
     try:
@@ -64,6 +139,12 @@ def test_data_structures():
         assert result.order_id == "test_order_123"
         print("✓ TradingResult creation successful")
         
+        # All three are slotted — no per-instance __dict__, so thousands of
+        # strategies/results stay compact; guard against regressing that
+        for obj in (credentials, config, result):
+            assert not hasattr(obj, "__dict__")
+        print("✓ Data structures are slotted (no per-instance __dict__)")
+
         # Test OrderSide enum
         assert OrderSide.BUY.value == "BUY"
         assert OrderSide.SELL.value == "SELL"
@@ -94,6 +175,43 @@ async def test_client_creation():
         assert isinstance(signature, str)
         assert len(signature) > 0
         print("✓ Signature generation works")
+
+        # The key-expanded HMAC context must be built once at construction
+        # and reused (copied) per signature, not rebuilt per call
+        template = client._hmac_template
+        repeat = client._generate_signature("12345", "GET", "/api/v1/account")
+        assert repeat == signature
+        assert client._hmac_template is template
+        print("✓ HMAC template is cached across signatures")
+
+        # The repeat signature above shares the full signing tuple, so it
+        # must be served from the per-client memo rather than recomputed
+        assert client._sign.cache_info().hits >= 1
+        print("✓ Signature memo serves repeated signing tuples")
+
+        # Property check: the template-copy fast path must stay
+        # byte-for-byte equivalent to one-shot HMAC-SHA256
+        import hashlib
+        import hmac
+        import random
+        rng = random.Random(42)
+        for _ in range(100):
+            ts = str(rng.randrange(10**12, 10**13))
+            path = f"/api/v1/{rng.choice(['account', 'order', 'tickers'])}"
+            body = rng.randbytes(rng.randrange(0, 64))
+            expected = hmac.new(
+                b"mock_secret", f"{ts}GET{path}".encode() + body, hashlib.sha256
+            ).hexdigest()
+            assert client._compute_signature(ts, "GET", path, body) == expected
+        print("✓ Signing matches one-shot HMAC reference")
+
+        # Internal keyed-BLAKE2b MAC: 16-byte digest, deterministic per
+        # client, and distinct from the exchange HMAC path
+        token = client._internal_sign(b"x")
+        assert len(token) == 32
+        assert client._internal_sign(b"x") == token
+        assert token != client._generate_signature("12345", "GET", "/api/v1/account")
+        print("✓ Internal BLAKE2b MAC works")
         
         # Test headers generation
         headers = client._get_headers("GET", "/api/v1/account")
@@ -136,46 +254,119 @@ async def test_dca_manager():
         assert config.symbol == "BTCUSDT"
         assert config.investment_amount == 100.0
         print("✓ DCA strategy storage successful")
-        
+
+        # Batch creation: 100 strategies registered behind a single await
+        batch_ids = await dca_manager.create_intelligent_dca_batch(
+            [(f"SYM{i}USDT", 10.0 + i) for i in range(100)]
+        )
+        assert len(batch_ids) == 100
+        assert all(bid in dca_manager.active_strategies for bid in batch_ids)
+        print("✓ Batch DCA strategy creation successful")
+
+        # Fire-time heap: schedule 1000 synthetic strategies out of order,
+        # peek is O(1) at the earliest, and due callbacks pop in fire order
+        for i in range(1000, 0, -1):
+            dca_manager._schedule(float(i), i)
+        assert dca_manager._scheduled[0][0] == 1.0
+        due = dca_manager._pop_due(10.0)
+        assert due == list(range(1, 11))
+        assert dca_manager._scheduled[0][0] == 11.0
+        print("✓ DCA scheduling heap pops callbacks in fire order")
+
         return True
     except Exception as e:
         print(f"❌ DCA manager test error: {e}")
         return False
 
+def make_validator(min_amount=0.01, max_frequency_hours=24 * 30):
+    """Build a parameter validator with the bounds baked into closure cells
+
+    The bounds are fixed at startup, so the per-request hot path reads them
+    from cells rather than re-resolving globals/attributes; math.isfinite is
+    likewise captured as a local. One C call covers the NaN/inf checks.
+    """
+    isfinite = math.isfinite
+
+    def validate(amount, frequency_hours):
+        parsed_amount = float(amount)
+        parsed_frequency = int(frequency_hours)
+        if (not isfinite(parsed_amount) or parsed_amount < min_amount
+                or not 1 <= parsed_frequency <= max_frequency_hours):
+            raise ValueError(f"Invalid params: {amount!r}, {frequency_hours!r}")
+        return parsed_amount, parsed_frequency
+
+    return validate
+
+
 def test_route_logic():
     """Test the route validation logic"""
     try:
-        # Test parameter validation logic similar to what's in routes.ts
-        
+        # Parameter validation logic similar to what's in routes.ts, compiled
+        # once into a closure with the deployment bounds
+        validate = make_validator()
+
         # Test valid parameters
-        symbol = "BTCUSDT"
-        investment_amount = 100.0
-        frequency_hours = 168
-        
-        parsed_amount = float(investment_amount)
-        parsed_frequency = int(frequency_hours)
-        
-        assert not (parsed_amount != parsed_amount)  # Check for NaN
-        assert parsed_amount > 0
-        assert not (parsed_frequency != parsed_frequency)  # Check for NaN  
-        assert parsed_frequency > 0
-        
+        assert validate(100.0, 168) == (100.0, 168)
+        assert validate("100.0", "168") == (100.0, 168)
         print("✓ Route parameter validation logic works")
-        
-        # Test invalid parameters would be caught
-        try:
-            invalid_amount = float("invalid")
-            assert False, "Should have thrown ValueError"
-        except ValueError:
-            pass  # Expected
-        
+
+        # Table of inputs the validator must reject
+        invalid_inputs = [
+            ("invalid", 168),
+            (float("nan"), 168),
+            (float("inf"), 168),
+            (-1.0, 168),
+            (0.0, 168),
+            (100.0, 0),
+            (100.0, 24 * 31),
+        ]
+        for amount, freq in invalid_inputs:
+            try:
+                validate(amount, freq)
+                assert False, f"Should have rejected {amount!r}, {freq!r}"
+            except ValueError:
+                pass  # Expected
+
         print("✓ Route parameter validation catches invalid input")
-        
+
         return True
     except Exception as e:
         print(f"❌ Route logic test error: {e}")
         return False
 
+def test_signature_perf():
+    """Performance gate: signing must stay in the low-microsecond range"""
+    try:
+        import time
+        from pionex_trade_client import PionexTradeClient, PionexCredentials
+
+        client = PionexTradeClient(PionexCredentials(
+            api_key="mock_key",
+            api_secret="mock_secret",
+            passphrase="mock_passphrase"
+        ))
+
+        # Benchmark the miss path directly — the memo in front of it would
+        # turn this into a dict-lookup benchmark
+        sign = client._compute_signature
+        args = ("1700000000000", "GET", "/api/v1/account", b"")
+        for _ in range(2_000):  # warmup: stabilizes allocator and caches
+            sign(*args)
+        start = time.perf_counter_ns()
+        for _ in range(10_000):
+            sign(*args)
+        per_call_ns = (time.perf_counter_ns() - start) / 10_000
+
+        # ~1.8 µs on reference hardware; the generous bound still catches a
+        # regression to per-call key expansion (an order of magnitude worse)
+        assert per_call_ns < 25_000, f"signing took {per_call_ns:.0f} ns/call"
+        print(f"✓ Signature perf gate passed ({per_call_ns:.0f} ns/call)")
+        return True
+    except Exception as e:
+        print(f"❌ Signature perf test error: {e}")
+        return False
+
+
 def test_error_handling():
     """Test error handling capabilities"""
     try:
@@ -208,45 +399,84 @@ async def run_tests():
     print("Running Pionex Trading Client Tests")
     print("===================================\n")
     
+    # Classify each test once up front — iscoroutinefunction is introspection
+    # that has no business running per dispatch
     tests = [
-        ("Import Test", test_imports),
-        ("Data Structures Test", test_data_structures),
-        ("Client Creation Test", test_client_creation),
-        ("DCA Manager Test", test_dca_manager),
-        ("Route Logic Test", test_route_logic),
-        ("Error Handling Test", test_error_handling)
+        (test_name, test_func, asyncio.iscoroutinefunction(test_func))
+        for test_name, test_func in [
+            ("Import Test", test_imports),
+            ("Data Structures Test", test_data_structures),
+            ("Client Creation Test", test_client_creation),
+            ("DCA Manager Test", test_dca_manager),
+            ("Route Logic Test", test_route_logic),
+            ("Error Handling Test", test_error_handling)
+        ]
     ]
-    
+    # Timing-sensitive tests stay out of the gather: run concurrently they
+    # would measure GIL contention from the other tests, not the code under
+    # test, and the perf gate would flake on busy CI
+    serial_tests = [
+        ("Signature Perf Test", test_signature_perf, False),
+    ]
+
     passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        print(f"\n--- {test_name} ---")
+    total = len(tests) + len(serial_tests)
+
+    # The tests share no state (each builds its own client/manager), so run
+    # them concurrently: async tests overlap on the loop, sync ones go to
+    # worker threads. Wall time becomes max(test) instead of sum(test).
+    results = await asyncio.gather(
+        *(test_func() if is_async else asyncio.to_thread(test_func)
+          for _, test_func, is_async in tests),
+        return_exceptions=True,
+    )
+
+    # Serial phase, after every gathered test has finished
+    for _, test_func, _ in serial_tests:
         try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            
-            if result:
-                passed += 1
-                print(f"✓ {test_name} PASSED")
-            else:
-                print(f"❌ {test_name} FAILED")
+            results.append(test_func())
         except Exception as e:
-            print(f"❌ {test_name} FAILED with exception: {e}")
-    
-    print(f"\n=== Test Results ===")
-    print(f"Passed: {passed}/{total}")
-    print(f"Failed: {total - passed}/{total}")
-    
+            results.append(e)
+    tests += serial_tests
+
+    # Report in declaration order regardless of completion order; buffer the
+    # whole report and flush it in one write so result lines never interleave
+    # with stragglers still printing from worker threads
+    report = []
+    for (test_name, _, _), result in zip(tests, results):
+        report.append(f"\n--- {test_name} ---")
+        if isinstance(result, BaseException):
+            report.append(f"❌ {test_name} FAILED with exception: {result}")
+        elif result:
+            passed += 1
+            report.append(f"✓ {test_name} PASSED")
+        else:
+            report.append(f"❌ {test_name} FAILED")
+
+    report.append("\n=== Test Results ===")
+    report.append(f"Passed: {passed}/{total}")
+    report.append(f"Failed: {total - passed}/{total}")
+
     if passed == total:
-        print("🎉 All tests passed! Pionex Trading Client is ready.")
-        return True
+        report.append("🎉 All tests passed! Pionex Trading Client is ready.")
     else:
-        print("⚠ Some tests failed. Please review the implementation.")
-        return False
+        report.append("⚠ Some tests failed. Please review the implementation.")
+    sys.stdout.write("\n".join(report) + "\n")
+    return passed == total
 
 if __name__ == "__main__":
-    success = asyncio.run(run_tests())
+    # libuv event loop cuts the scheduling overhead that dominates these
+    # small async tests; fall back to the stock loop when unavailable
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    with asyncio.Runner() as runner:
+        # On 3.12+ eager tasks let coroutines that finish synchronously
+        # (e.g. create_intelligent_dca) skip the scheduler round-trip
+        if hasattr(asyncio, "eager_task_factory"):
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        success = runner.run(run_tests())
     sys.exit(0 if success else 1)
\ No newline at end of file